@@ -5,6 +5,7 @@ Accumulators.
 
 
 
+import sys
 from functools import reduce
 from operator import mul
 from typing import Any
@@ -15,6 +16,30 @@ from collections.abc import Callable, Iterable
 MISSING:object = object()
 """Sentinel to mark empty parameters."""
 
+def _numeric_array(a:Any) -> bool:
+    """Return if `a` is a non-empty plain NumPy array of a numeric dtype.
+    
+    Subclasses like masked arrays are rejected, they take the Python path.
+    """
+    #reject everything else before looking up numpy
+    t = type(a)
+    if t.__name__ != 'ndarray':
+        return False
+    #if numpy isn't imported, `a` can't be an array
+    np = sys.modules.get('numpy')
+    return np is not None and t is np.ndarray \
+            and a.dtype.kind in 'biufc' and a.ndim > 0 and len(a) > 0
+
+def _empty(default:Any) -> Any:
+    """Return `default` for an empty accumulation, raise if it is `MISSING`."""
+    if default is not MISSING:
+        return default
+    else:
+        raise TypeError(
+                'accumulation of empty iterable with no'
+                ' initial or default value'
+        )
+
 def reduce_default(function:Callable[[Any,Any],Any], iterable:Iterable[Any], *, initial:Any=MISSING, default:Any=MISSING) -> Any:
     """Apply function of two arguments cumulatively to the iterable.
     
@@ -34,13 +59,7 @@ def reduce_default(function:Callable[[Any,Any],Any], iterable:Iterable[Any], *,
         try:
             initial = next(it)
         except StopIteration:
-            if default is not MISSING:
-                return default
-            else:
-                raise TypeError(
-                        'accumulation of empty iterable with no'
-                        ' initial or default value'
-                )
+            return _empty(default)
         return reduce(function, it, initial)
 
 def sum_default(iterable:Iterable[Any], *, initial:Any=MISSING, default:Any=0) -> Any:
@@ -54,21 +73,21 @@ def sum_default(iterable:Iterable[Any], *, initial:Any=MISSING, default:Any=0) -
     - If `iterable` is empty and `initial` is `MISSING`, but `default` is not,
       then `default` is returned.
     - If `initial` is `MISSING`, then there is truly no initial `0+=`.
+    
+    Non-empty NumPy arrays of a numeric dtype are summed along their first
+    axis by NumPy if `initial` is `MISSING` (floats are then summed
+    pairwise).
     """
-    if initial is not MISSING:
+    if initial is MISSING and _numeric_array(iterable):
+        return iterable.sum(axis=0, dtype=iterable.dtype)
+    elif initial is not MISSING:
         return sum(iterable, initial)
     else:
         it = iter(iterable)
         try:
             initial = next(it)
         except StopIteration:
-            if default is not MISSING:
-                return default
-            else:
-                raise TypeError(
-                        'accumulation of empty iterable with no'
-                        ' initial or default value'
-                )
+            return _empty(default)
         return sum(it, start=initial)
 
 def prod_default(iterable:Iterable[Any], *, initial:Any=MISSING, default:Any=1) -> Any:
@@ -82,7 +101,12 @@ def prod_default(iterable:Iterable[Any], *, initial:Any=MISSING, default:Any=1)
     - If `iterable` is empty and `initial` is `MISSING`, but `default` is not,
       then `default` is returned.
     - If `initial` is `MISSING`, then there is truly no initial `1*=`.
+    
+    Non-empty NumPy arrays of a numeric dtype are multiplied along their
+    first axis by NumPy if `initial` is `MISSING`.
     """
+    if initial is MISSING and _numeric_array(iterable):
+        return iterable.prod(axis=0, dtype=iterable.dtype)
     #don't use math.prod, as it may reject non-numeric values
     return reduce_default(mul, iterable, initial=initial, default=default)
 
@@ -97,5 +121,12 @@ def sumprod_default(a:Iterable[Any], b:Iterable[Any], *, initial:Any=MISSING, de
     - If `a` or `b` is empty and `initial` is `MISSING`, but `default` is not,
       then `default` is returned.
     - If `initial` is `MISSING`, then there is truly no initial `0+=`.
+    
+    Non-empty one-dimensional NumPy arrays of a numeric dtype are handed to
+    `numpy.dot` if `initial` is `MISSING`.
     """
+    if initial is MISSING and _numeric_array(a) and _numeric_array(b) \
+            and a.ndim == b.ndim == 1:
+        n = min(len(a), len(b))
+        return a[:n].dot(b[:n])
     return sum_default(map(mul, a, b), initial=initial, default=default)
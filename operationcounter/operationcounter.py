@@ -1,13 +1,242 @@
 import operator
 from collections import Counter
-from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from itertools import compress
 from typing import Any, ClassVar, Generic, Optional, overload, TypeVar
-from collections.abc import Collection, Generator, Mapping, Set, Sequence
+from collections.abc import Collection, Iterator, Mapping, Set, Sequence
 
 __all__ = ('OperationCounter', 'count_ops')
 
 
 
+# --- count storage ---
+_OPS:tuple[str, ...] = (
+    #conversion
+    'bool', 'int', 'float', 'complex',
+    #comparison
+    'lt', 'le', 'eq', 'ne', 'gt', 'ge',
+    #unary
+    'pos', 'neg', 'abs', 'invert',
+    #arithmetic
+    'add',      'radd',      'iadd',
+    'sub',      'rsub',      'isub',
+    'mul',      'rmul',      'imul',
+    'matmul',   'rmatmul',   'imatmul',
+    'truediv',  'rtruediv',  'itruediv',
+    'floordiv', 'rfloordiv', 'ifloordiv',
+    'mod',      'rmod',      'imod',
+    'pow',      'rpow',      'ipow',
+    'divmod',   'rdivmod',
+    #bitwise
+    'and',      'rand',      'iand',
+    'or',       'ror',       'ior',
+    'xor',      'rxor',      'ixor',
+    'lshift',   'rlshift',   'ilshift',
+    'rshift',   'rrshift',   'irshift'
+)
+"""Names of all counted operations."""
+
+_INDEX:dict[str, int] = {k: i for i, k in enumerate(_OPS)}
+"""Slot of each operation in `_counts`."""
+
+_GLOBAL:list[int] = [0] * len(_OPS)
+"""Operation counts shared by all threads outside of `count_ops`."""
+
+class _Paused(list[int]):
+    """Empty (falsy) placeholder for counts while counting is disabled.
+    
+    Holds the counts that were active before `OperationCounter.disable`, so
+    that `OperationCounter.enable` can restore them.
+    """
+    
+    __slots__ = ('counts',)
+    
+    def __init__(self, counts:list[int]) -> None:
+        super().__init__()
+        self.counts = counts
+
+_counts:ContextVar[list[int]] = ContextVar(
+        'operationcounter_counts', default=_GLOBAL)
+"""Live operation counts of the current context, indexed like `_OPS`.
+
+Defaults to `_GLOBAL`; `count_ops` installs a fresh list for the duration of
+its scope. An empty `_Paused` if counting is disabled, so the operations
+only need a truth test before counting.
+"""
+
+_NONE:tuple[int, ...] = (0,) * len(_OPS)
+"""Counts shown while counting is disabled."""
+
+_SLOTS:range = range(len(_OPS))
+"""All slot indices of the counts."""
+
+_POW, _RPOW, _IPOW = _INDEX['pow'], _INDEX['rpow'], _INDEX['ipow']
+_DIVMOD, _RDIVMOD = _INDEX['divmod'], _INDEX['rdivmod']
+
+
+class _CounterView(Mapping[str, int]):
+    """Live read-only view of operation counts.
+    
+    Behaves like a read-only `Counter[str]`: operations that weren't
+    performed count as zero and are not listed, and the non-mutating
+    `Counter` methods and operators are available (they return new
+    `Counter`s). Mutating methods like `clear` or `update` are not.
+    
+    Views the given counts or, if `None`, the counts of the current context.
+    """
+    
+    __slots__ = ('_counts',)
+    
+    def __init__(self, counts:Optional[list[int]]=None) -> None:
+        self._counts = counts
+    
+    def _list(self) -> Sequence[int]:
+        if self._counts is not None:
+            return self._counts
+        return _counts.get() or _NONE
+    
+    def __getitem__(self, key:str) -> int:
+        i = _INDEX.get(key)
+        return 0 if i is None else self._list()[i]
+    
+    def __contains__(self, key:object) -> bool:
+        return bool(self[key])
+    
+    def __iter__(self) -> Iterator[str]:
+        return (k for k, c in zip(_OPS, self._list()) if c)
+    
+    def __len__(self) -> int:
+        counts = self._list()
+        return len(counts) - counts.count(0)
+    
+    def __repr__(self) -> str:
+        return repr(self.copy())
+    
+    def get(self, key:str, default:Any=None) -> Any:
+        return self[key] if key in self else default
+    
+    def copy(self) -> Counter[str]:
+        """Return the current counts as a new `Counter`."""
+        counts = self._list()
+        counter:Counter[str] = Counter()
+        #plain dict update, all in C, keys are unique & counts non-zero
+        dict.update(counter, compress(zip(_OPS, counts), counts))
+        return counter
+    
+    
+    # --- read-only Counter API, delegated to a copy ---
+    def most_common(self, n:Optional[int]=None) -> list[tuple[str, int]]:
+        """List the `n` most common operations and their counts."""
+        return self.copy().most_common(n)
+    
+    def total(self) -> int:
+        """Return the total number of counted operations."""
+        return sum(self._list())
+    
+    def elements(self) -> Iterator[str]:
+        """Iterate over the operations, each repeated as often as counted."""
+        return self.copy().elements()
+    
+    def __add__(self, other:Any) -> Counter[str]:
+        return self.copy() + other
+    
+    def __radd__(self, other:Any) -> Counter[str]:
+        return other + self.copy()
+    
+    def __sub__(self, other:Any) -> Counter[str]:
+        return self.copy() - other
+    
+    def __rsub__(self, other:Any) -> Counter[str]:
+        return other - self.copy()
+    
+    def __or__(self, other:Any) -> Counter[str]:
+        return self.copy() | other
+    
+    def __ror__(self, other:Any) -> Counter[str]:
+        return other | self.copy()
+    
+    def __and__(self, other:Any) -> Counter[str]:
+        return self.copy() & other
+    
+    def __rand__(self, other:Any) -> Counter[str]:
+        return other & self.copy()
+    
+    def __eq__(self, other:object) -> bool:
+        return self.copy() == other
+    
+    def __lt__(self, other:Any) -> bool:
+        return self.copy() < other
+    
+    def __le__(self, other:Any) -> bool:
+        return self.copy() <= other
+    
+    def __gt__(self, other:Any) -> bool:
+        return self.copy() > other
+    
+    def __ge__(self, other:Any) -> bool:
+        return self.copy() >= other
+    
+    def __pos__(self) -> Counter[str]:
+        return +self.copy()
+    
+    def __neg__(self) -> Counter[str]:
+        return -self.copy()
+
+
+
+# --- grouping ---
+_FAMILIES:dict[str, tuple[str, ...]] = {
+    #comparison
+    'cmp':      ('lt', 'le', 'eq', 'ne', 'gt', 'ge'),
+    #unary
+    'pos':      ('pos',),
+    'neg':      ('neg',),
+    'abs':      ('abs',),
+    'invert':   ('invert',),
+    #arithmetic
+    'add':      ('add', 'iadd', 'radd'),
+    'sub':      ('sub', 'isub', 'rsub'),
+    'mul':      ('mul', 'imul', 'rmul'),
+    'truediv':  ('truediv', 'itruediv', 'rtruediv'),
+    'floordiv': ('floordiv', 'ifloordiv', 'rfloordiv'),
+    'mod':      ('mod', 'imod', 'rmod'),
+    'pow':      ('pow', 'ipow', 'rpow'),
+    'divmod':   ('divmod', 'rdivmod'),
+    #bitwise
+    'and':      ('and', 'iand', 'rand'),
+    'or':       ('or', 'ior', 'ror'),
+    'xor':      ('xor', 'ixor', 'rxor'),
+    'lshift':   ('lshift', 'ilshift', 'rlshift'),
+    'rshift':   ('rshift', 'irshift', 'rrshift')
+}
+"""Operation families used by `OperationCounter.grouped`."""
+
+_FAMILY:dict[str, str] = {k: family
+                          for family, keys in _FAMILIES.items()
+                          for k in keys}
+"""Family of each grouped operation."""
+
+
+
+def _object_array(np:Any, r:Any) -> Any:
+    """Return the result `r` of an object ufunc as an object array.
+    
+    For scalar input `np.frompyfunc` returns a bare scalar; it is put into a
+    0-d array as is, instead of letting NumPy parse it (e.g. as a sequence).
+    """
+    if isinstance(r, np.ndarray):
+        return r
+    out = np.empty((), dtype=object)
+    out[()] = r
+    return out
+
+
+_BUILTIN_SEQUENCES_SETS:frozenset[type] = frozenset(
+        (tuple, list, set, frozenset))
+"""Built-in collections that can be rebuilt from an iterable of elements."""
+
+
+
 T = TypeVar('T')
 
 class OperationCounter(Generic[T]):
@@ -17,9 +246,16 @@ class OperationCounter(Generic[T]):
     counted.
     """
     
+    __slots__ = ('v', '__weakref__')
     
-    counter:ClassVar[Counter[str]] = Counter()
-    """Live global counter of all operations."""
+    counter:ClassVar[_CounterView] = _CounterView()
+    """Live view of all operation counts.
+    
+    Behaves like a read-only `Counter[str]`; use `reset` instead of `clear`
+    and `snapshot` for a mutable copy. Shows the counts of the innermost
+    `count_ops` scope of the current thread or task, otherwise the counts
+    shared by all threads.
+    """
     
     def __init__(self, v:T) -> None:
         """Wrap `v` into an `OperationCounter`."""
@@ -29,8 +265,33 @@ class OperationCounter(Generic[T]):
     # --- utilities ---
     @staticmethod
     def reset() -> None:
-        """Clear all recorded operation counts."""
-        OperationCounter.counter.clear()
+        """Clear all recorded operation counts.
+        
+        The counts are cleared in place, so views like the one yielded by
+        `count_ops` stay live.
+        """
+        if counts := _counts.get():
+            counts[:] = _NONE
+    
+    @staticmethod
+    def disable() -> None:
+        """Stop counting operations in the current thread or task.
+        
+        Operations then only cost their wrapped computation. A `count_ops`
+        scope still counts.
+        """
+        if counts := _counts.get():
+            _counts.set(_Paused(counts))
+    
+    @staticmethod
+    def enable() -> None:
+        """Resume counting operations in the current thread or task.
+        
+        Operations are counted where they were counted before `disable`,
+        e.g. in the enclosing `count_ops` scope or the global counter.
+        """
+        if isinstance(counts := _counts.get(), _Paused):
+            _counts.set(counts.counts)
     
     @staticmethod
     def snapshot() -> Counter[str]:
@@ -49,7 +310,13 @@ class OperationCounter(Generic[T]):
     @staticmethod
     def wrapCollection(s:Collection[T]) -> Collection[OperationCounter[T]]:
         """Wrap the elements of `s` into `OperationCounter`s."""
-        if isinstance(s, Mapping):
+        #fast paths for the built-in collections, skipping the ABC checks
+        if type(s) in _BUILTIN_SEQUENCES_SETS:
+            return type(s)(map(OperationCounter, s))
+        elif type(s) is dict:
+            return {OperationCounter(k): OperationCounter(v)
+                    for k, v in s.items()}
+        elif isinstance(s, Mapping):
             return type(s)(
                     (OperationCounter.wrap(k), OperationCounter.wrap(v))
                     for k, v in s.items())
@@ -67,7 +334,7 @@ class OperationCounter(Generic[T]):
             raise ModuleNotFoundError(
                 'OperationCounter.wrapArray requires `numpy` to be installed.'
             ) from e
-        return np.vectorize(OperationCounter.wrap, otypes=[object])(a)
+        return _object_array(np, np.frompyfunc(OperationCounter, 1, 1)(a))
     
     
     @overload
@@ -84,7 +351,13 @@ class OperationCounter(Generic[T]):
     @staticmethod
     def unwrapCollection(s:Collection[OperationCounter[T]]) -> Collection[T]:
         """Unwrap the elements of `s` from `OperationCounter`s."""
-        if isinstance(s, Mapping):
+        #fast paths for the built-in collections, skipping the ABC checks
+        if type(s) in _BUILTIN_SEQUENCES_SETS:
+            return type(s)(map(OperationCounter.unwrap, s))
+        elif type(s) is dict:
+            unwrap = OperationCounter.unwrap
+            return {unwrap(k): unwrap(v) for k, v in s.items()}
+        elif isinstance(s, Mapping):
             return type(s)(
                     (OperationCounter.unwrap(k), OperationCounter.unwrap(v))
                     for k, v in s.items())
@@ -102,11 +375,12 @@ class OperationCounter(Generic[T]):
             raise ModuleNotFoundError(
                 'OperationCounter.unwrapArray requires `numpy` to be installed.'
             ) from e
-        return np.vectorize(OperationCounter.unwrap, otypes=[object])(a)
+        return _object_array(np,
+                np.frompyfunc(OperationCounter.unwrap, 1, 1)(a))
     
     
     @staticmethod
-    def grouped(counter:Counter[str]) -> Counter[str]:
+    def grouped(counter:Mapping[str, int]) -> Counter[str]:
         """Group individual operation counts into broader categories.
         
         Counts are summed into the following groups:
@@ -131,11 +405,11 @@ class OperationCounter(Generic[T]):
             - `lshift`   = `lshift` + `ilshift` + `rlshift`
             - `rshift`   = `rshift` + `irshift` + `rrshift`
         
-        Unrecognised counts are copied unchanged.
+        Unrecognised counts are copied unchanged. Zero counts are left out.
         
         Parameters
         ----------
-        counter: Counter[str]
+        counter: Mapping[str, int]
             A mapping from operation names to the number of times each
             operation has been executed.
         
@@ -145,42 +419,11 @@ class OperationCounter(Generic[T]):
             A new counter where related operations are summed together under
             a single key.
         """
-        families:dict[str, tuple[str, ...]] = {
-            #comparison
-            'cmp':      ('lt', 'le', 'eq', 'ne', 'gt', 'ge'),
-            #unary
-            'pos':      ('pos',),
-            'neg':      ('neg',),
-            'abs':      ('abs',),
-            'invert':   ('invert',),
-            #arithmetic
-            'add':      ('add', 'iadd', 'radd'),
-            'sub':      ('sub', 'isub', 'rsub'),
-            'mul':      ('mul', 'imul', 'rmul'),
-            'truediv':  ('truediv', 'itruediv', 'rtruediv'),
-            'floordiv': ('floordiv', 'ifloordiv', 'rfloordiv'),
-            'mod':      ('mod', 'imod', 'rmod'),
-            'pow':      ('pow', 'ipow', 'rpow'),
-            'divmod':   ('divmod', 'rdivmod'),
-            #bitwise
-            'and':      ('and', 'iand', 'rand'),
-            'or':       ('or', 'ior', 'ror'),
-            'xor':      ('xor', 'ixor', 'rxor'),
-            'lshift':   ('lshift', 'ilshift', 'rlshift'),
-            'rshift':   ('rshift', 'irshift', 'rrshift')
-        }
-        
         grouped:Counter[str] = Counter()
-        for family, keys in families.items():
-            if (s := sum(counter.get(k, 0) for k in keys)):
-                grouped[family] = s
-        
-        #keep any keys we didn't map
-        mapped_keys = {k for keys in families.values() for k in keys}
         for k, v in counter.items():
-            if k not in mapped_keys:
-                grouped[k] += v
-        
+            #unrecognised keys are their own family
+            if v:
+                grouped[_FAMILY.get(k, k)] += v
         return grouped
     
     
@@ -202,43 +445,53 @@ class OperationCounter(Generic[T]):
     # --- special arithmetic (non-regular signatures) ---
     def __pow__(self, other:Any, mod:Optional[int]=None) \
             -> OperationCounter[T]:
-        OperationCounter.counter['pow'] += 1
-        o = OperationCounter.unwrap(other)
+        if counts := _counts.get():
+            counts[_POW] += 1
+        o = other.v if isinstance(other, OperationCounter) else other
         return OperationCounter(
-                pow(self.v, o, mod) if mod is not None else pow(self.v, o))
+                self.v ** o if mod is None else pow(self.v, o, mod))
     
     def __rpow__(self, other:Any, mod:Optional[int]=None) \
             -> OperationCounter[T]:
-        OperationCounter.counter['rpow'] += 1
-        o = OperationCounter.unwrap(other)
+        if counts := _counts.get():
+            counts[_RPOW] += 1
+        o = other.v if isinstance(other, OperationCounter) else other
         return OperationCounter(
-                pow(o, self.v, mod) if mod is not None else pow(o, self.v))
+                o ** self.v if mod is None else pow(o, self.v, mod))
     
     def __ipow__(self, other:Any, mod:Optional[int]=None) \
             -> OperationCounter[T]:
-        OperationCounter.counter['ipow'] += 1
-        o = OperationCounter.unwrap(other)
-        self.v = pow(self.v, o, mod) if mod is not None else pow(self.v, o)
+        if counts := _counts.get():
+            counts[_IPOW] += 1
+        o = other.v if isinstance(other, OperationCounter) else other
+        #not `**=`, which fails for integer arrays & mutates aliased values
+        self.v = self.v ** o if mod is None else pow(self.v, o, mod)
         return self
     
     def __divmod__(self, other:Any) \
             -> tuple[OperationCounter[T], OperationCounter[T]]:
-        OperationCounter.counter['divmod'] += 1
-        q, r = divmod(self.v, OperationCounter.unwrap(other))
+        if counts := _counts.get():
+            counts[_DIVMOD] += 1
+        o = other.v if isinstance(other, OperationCounter) else other
+        q, r = divmod(self.v, o)
         return OperationCounter(q), OperationCounter(r)
     
     def __rdivmod__(self, other:Any) \
             -> tuple[OperationCounter[T], OperationCounter[T]]:
-        OperationCounter.counter['rdivmod'] += 1
-        q, r = divmod(OperationCounter.unwrap(other), self.v)
+        if counts := _counts.get():
+            counts[_RDIVMOD] += 1
+        o = other.v if isinstance(other, OperationCounter) else other
+        q, r = divmod(o, self.v)
         return OperationCounter(q), OperationCounter(r)
 
 
 
 # --- operation factories ---
 def _convert(key, fn):
+    i = _INDEX[key]
     def method(self):
-        OperationCounter.counter[key] += 1
+        if counts := _counts.get():
+            counts[i] += 1
         return fn(self.v)
     return method
 
@@ -250,9 +503,12 @@ for _name, _fn in {'bool':    bool,
 
 
 def _cmp(key, fn):
+    i = _INDEX[key]
     def method(self, other):
-        OperationCounter.counter[key] += 1
-        return fn(self.v, OperationCounter.unwrap(other))
+        if counts := _counts.get():
+            counts[i] += 1
+        o = other.v if isinstance(other, OperationCounter) else other
+        return fn(self.v, o)
     return method
 
 for _name, _fn in {'lt': operator.lt,
@@ -265,8 +521,10 @@ for _name, _fn in {'lt': operator.lt,
 
 
 def _unary(key, fn):
+    i = _INDEX[key]
     def method(self):
-        OperationCounter.counter[key] += 1
+        if counts := _counts.get():
+            counts[i] += 1
         return OperationCounter(fn(self.v))
     return method
 
@@ -278,21 +536,30 @@ for _name, _fn in {'pos':    operator.pos,
 
 
 def _binary(key, fn):
+    i = _INDEX[key]
     def method(self, other):
-        OperationCounter.counter[key] += 1
-        return OperationCounter(fn(self.v, OperationCounter.unwrap(other)))
+        if counts := _counts.get():
+            counts[i] += 1
+        o = other.v if isinstance(other, OperationCounter) else other
+        return OperationCounter(fn(self.v, o))
     return method
 
 def _rbinary(key, fn):
+    i = _INDEX[key]
     def method(self, other):
-        OperationCounter.counter[key] += 1
-        return OperationCounter(fn(OperationCounter.unwrap(other), self.v))
+        if counts := _counts.get():
+            counts[i] += 1
+        o = other.v if isinstance(other, OperationCounter) else other
+        return OperationCounter(fn(o, self.v))
     return method
 
 def _ibinary(key, fn):
+    i = _INDEX[key]
     def method(self, other):
-        OperationCounter.counter[key] += 1
-        self.v = fn(self.v, OperationCounter.unwrap(other))
+        if counts := _counts.get():
+            counts[i] += 1
+        o = other.v if isinstance(other, OperationCounter) else other
+        self.v = fn(self.v, o)
         return self
     return method
 
@@ -314,20 +581,54 @@ for _name, (_fn, _ifn) in {
     setattr(OperationCounter, f'__i{_name}__', _ibinary(f'i{_name}', _ifn))
 #pow, rpow, ipow, divmod, rdivmod don't fit this pattern
 #and are therefore written explicitly
+#the unwrapping is inlined in all operations as it is the hot path
 
 
 
-@contextmanager
-def count_ops() -> Generator[Counter[str]]:
-    """Context manager that yields the operation counter.
+class count_ops:
+    """Context manager that yields a fresh operation counter.
+    
+    All operations performed in the scope, in the current thread or asyncio
+    task, are counted separately from any other thread or task. The counter
+    is yielded to the caller and keeps its final counts after the scope
+    ends. While the scope is active, `OperationCounter.counter` shows the
+    same counts.
+    
+    Scopes can be nested. On exit the counts of a scope are added to the
+    enclosing scope (or the global counter), unless counting is disabled
+    there. The global counter is not reset, so after the scope it holds
+    everything counted before and in it.
     
-    The `OperationCounter.counter` is cleared on entry and yielded to the
-    caller.
+    If the scope is exited in another context than it was entered (e.g. an
+    async generator resumed by another task), the counts of the entered
+    context can't be restored; the exiting context continues with the
+    counts that were active on entry.
+    
+    Written as a plain class rather than with `contextlib.contextmanager`
+    to keep entering and exiting cheap.
     
     Yields
     ------
-    Counter[str]
-        The global `OperationCounter.counter`.
+    Mapping[str, int]
+        A live read-only view of the counts of this scope.
     """
-    OperationCounter.reset()
-    yield OperationCounter.counter
+    
+    __slots__ = ('_counts', '_token')
+    
+    def __enter__(self) -> Mapping[str, int]:
+        self._counts:list[int] = [0] * len(_OPS)
+        self._token:Token[list[int]] = _counts.set(self._counts)
+        return _CounterView(self._counts)
+    
+    def __exit__(self, *exc_info:Any) -> None:
+        try:
+            _counts.reset(self._token)
+        except ValueError:
+            #exited in a different context than entered
+            old = self._token.old_value
+            _counts.set(_GLOBAL if old is Token.MISSING else old)
+        inner = self._counts
+        if any(inner) and (outer := _counts.get()):
+            #only merge the operations that were performed
+            for i in compress(_SLOTS, inner):
+                outer[i] += inner[i]
@@ -1,4 +1,5 @@
 from operationcounter import *
+import numpy as np
 import pytest
 
 
@@ -12,7 +13,22 @@ def test_sum_default():
         assert counts == {'add':3, 'eq':1}
     assert sum_default([]) == 0
     assert sum_default([], default=2) == 2
+    assert sum_default(iter([]), default=2) == 2
+    assert sum_default(np.array([1, 2, 3, 4])) == 10
+    assert sum_default(np.array([1, 2, 3, 4]), initial=5) == 15
+    assert np.array_equal(sum_default(np.array([[1, 2], [3, 4]])), [4, 6])
+    assert sum_default(np.array([]), default=2) == 2
+    with count_ops() as counts:
+        assert sum_default(np.array([1, 2, 3]),
+                           initial=OperationCounter(0)) == 6
+        assert counts == {'add':3, 'eq':1}
     assert sum_default(a, initial=5) == 15
+    #non-numeric dtypes keep the Python accumulation
+    assert sum_default(np.array([1, 2], dtype='timedelta64[s]')) \
+            == np.timedelta64(3, 's')
+    #so do array subclasses
+    assert sum_default(np.ma.array([1, 2, 3], mask=[0, 1, 0])) \
+            is np.ma.masked
     with pytest.raises(TypeError):
         sum_default([], initial=MISSING, default=MISSING)
 
@@ -25,6 +41,14 @@ def test_prod_default():
         assert counts == {'mul':3, 'eq':1}
     assert prod_default([]) == 1
     assert prod_default([], default=2) == 2
+    assert prod_default(iter([]), default=2) == 2
+    assert prod_default(np.array([1, 2, 3, 4])) == 24
+    assert prod_default(np.array([1, 2, 3, 4]), initial=5) == 120
+    assert prod_default(np.array([]), default=2) == 2
+    with count_ops() as counts:
+        assert prod_default(np.array([2, 3, 4]),
+                            initial=OperationCounter(1)) == 24
+        assert counts == {'mul':3, 'eq':1}
     assert prod_default(a, initial=5) == 120
     with pytest.raises(TypeError):
         prod_default([], initial=MISSING, default=MISSING)
@@ -40,5 +64,15 @@ def test_sumprod_default():
     assert sumprod_default([], []) == 0
     assert sumprod_default([], [], default=2) == 2
     assert sumprod_default(a, b, initial=10) == 80
+    assert sumprod_default([1, 2, 3, 4], (5, 6, 7, 8, 9)) == 70
+    assert sumprod_default([1.5, 2], [2, 3.0]) == 9.0
+    assert sumprod_default(np.array([1, 2, 3, 4]),
+                           np.array([5, 6, 7, 8, 9])) == 70
+    assert sumprod_default(np.array([1, 2, 3, 4]),
+                           np.array([5, 6, 7, 8, 9]), initial=10) == 80
+    with count_ops() as counts:
+        assert sumprod_default(np.array([1, 2, 3]), np.array([4, 5, 6]),
+                               initial=OperationCounter(0)) == 32
+        assert counts == {'add':3, 'eq':1}
     with pytest.raises(TypeError):
         sumprod_default([], [], initial=MISSING, default=MISSING)
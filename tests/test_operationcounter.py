@@ -1,5 +1,10 @@
 from operationcounter import *
+from collections import Counter
+from contextvars import copy_context
+from threading import Thread
+import weakref
 import numpy as np
+import pytest
 
 def test_operationcounter():
     with count_ops() as counts:
@@ -13,6 +18,10 @@ def test_operationcounter():
         assert counts == {'add':1, 'isub':1, 'mul':1, 'gt':1}
         assert OperationCounter.grouped(counts) \
                 == {'add':1, 'sub':1, 'mul':1, 'cmp':1}
+    
+    grouped = OperationCounter.grouped({'add':0, 'radd':2, 'matmul':0})
+    assert grouped == {'add':2}
+    assert set(grouped) == {'add'}
 
 def test_wrapping():
     #sequence
@@ -23,6 +32,19 @@ def test_wrapping():
     t = OperationCounter.wrapCollection(t)
     assert OperationCounter.unwrapCollection(t) == (1, 2, 3)
     
+    l = [1, 2]
+    assert OperationCounter.wrapCollection(l) == \
+            [OperationCounter(1), OperationCounter(2)]
+    assert OperationCounter.unwrapCollection(
+            OperationCounter.wrapCollection(l)) == [1, 2]
+    
+    #set
+    s = {1, 2}
+    assert OperationCounter.wrapCollection(s) == \
+            {OperationCounter(1), OperationCounter(2)}
+    assert OperationCounter.unwrapCollection(
+            OperationCounter.wrapCollection(s)) == {1, 2}
+    
     #mapping
     d = {1:2, 3:4}
     assert OperationCounter.wrapCollection(d) == \
@@ -39,3 +61,171 @@ def test_wrapping():
     
     a = OperationCounter.unwrapArray(a)
     assert np.array_equal(OperationCounter.unwrapArray(a), np.array([1, 2]))
+    
+    #scalar
+    a = OperationCounter.wrapArray(5)
+    assert a.shape == () and a[()] == OperationCounter(5)
+    a = OperationCounter.unwrapArray(OperationCounter([1, 2]))
+    assert a.shape == () and a[()] == [1, 2]
+
+def test_counter():
+    OperationCounter.reset()
+    a = OperationCounter(3)
+    a + a
+    a += 1
+    assert OperationCounter.counter == {'add':1, 'iadd':1}
+    assert OperationCounter.counter['mul'] == 0
+    assert 'mul' not in OperationCounter.counter
+    
+    s = OperationCounter.snapshot()
+    a * a
+    assert s == {'add':1, 'iadd':1}
+    assert OperationCounter.counter == {'add':1, 'iadd':1, 'mul':1}
+    
+    #read-only Counter API
+    c = OperationCounter.counter
+    assert c.total() == 3
+    assert c.most_common(1) == [('add', 1)]
+    assert sorted(c.elements()) == ['add', 'iadd', 'mul']
+    assert c - s == {'mul':1}
+    assert OperationCounter.snapshot() - s == {'mul':1}
+    assert c + s == {'add':2, 'iadd':2, 'mul':1}
+    assert s + c == {'add':2, 'iadd':2, 'mul':1}
+    assert c | Counter({'add':2}) == {'add':2, 'iadd':1, 'mul':1}
+    assert c & s == {'add':1, 'iadd':1}
+    assert +c == {'add':1, 'iadd':1, 'mul':1}
+    assert c == Counter({'add':1, 'iadd':1, 'mul':1, 'sub':0})
+    assert c != Counter({'add':1})
+    assert s < c and s <= c and c > s and c >= s
+    assert not c < s
+    
+    OperationCounter.reset()
+    assert OperationCounter.counter == {}
+
+def test_count_ops_scope():
+    OperationCounter.reset()
+    a = OperationCounter(3)
+    a + a
+    with count_ops() as counts:
+        a * a
+        assert counts == {'mul':1}
+        assert OperationCounter.counter == {'mul':1}
+        OperationCounter.reset()
+        a * a
+        assert counts == {'mul':1}
+    a - a
+    assert counts == {'mul':1}
+    assert OperationCounter.counter == {'add':1, 'mul':1, 'sub':1}
+
+def test_count_ops_nested():
+    a = OperationCounter(3)
+    with count_ops() as outer:
+        a + a
+        with count_ops() as inner:
+            a * a
+            assert inner == {'mul':1}
+            assert outer == {'add':1}
+        assert inner == {'mul':1}
+        assert outer == {'add':1, 'mul':1}
+
+def test_count_ops_other_context():
+    def exit_scope(cm):
+        cm.__exit__(None, None, None)
+        assert OperationCounter.counter['add'] >= 1
+    
+    def body():
+        cm = count_ops()
+        counts = cm.__enter__()
+        OperationCounter(3) + 1
+        copy_context().run(exit_scope, cm)
+        assert counts == {'add':1}
+    
+    copy_context().run(body)
+
+def test_count_ops_threads():
+    def work(n, results, i):
+        with count_ops() as counts:
+            a = OperationCounter(0)
+            for _ in range(n):
+                a += 1
+            results[i] = dict(counts)
+    
+    results = [None] * 4
+    threads = [Thread(target=work, args=(1000*(i+1), results, i))
+               for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == [{'iadd':1000*(i+1)} for i in range(4)]
+
+def test_pow():
+    with count_ops() as counts:
+        a = OperationCounter(3)
+        assert (a ** 2).v == 9
+        assert (2 ** a).v == 8
+        assert pow(a, 2, 5).v == 4
+        a **= 2
+        assert a.v == 9
+        v = np.array([1, 4])
+        b = OperationCounter(v)
+        b **= 0.5
+        assert np.array_equal(b.v, [1., 2.])
+        assert np.array_equal(v, [1, 4])
+        assert counts == {'pow':2, 'rpow':1, 'ipow':2}
+
+def test_disable():
+    OperationCounter.reset()
+    OperationCounter.disable()
+    try:
+        a = OperationCounter(3)
+        a + a
+        assert OperationCounter.counter == {}
+        with count_ops() as counts:
+            a * a
+        assert counts == {'mul':1}
+    finally:
+        OperationCounter.enable()
+    a - a
+    assert OperationCounter.counter == {'sub':1}
+    
+    #inside a scope
+    with count_ops() as counts:
+        OperationCounter.enable()
+        a + a
+        OperationCounter.disable()
+        a * a
+        OperationCounter.enable()
+        a - a
+    assert counts == {'add':1, 'sub':1}
+    
+    #disabled outside, disabled & enabled inside a scope
+    OperationCounter.disable()
+    try:
+        with count_ops() as counts:
+            OperationCounter.disable()
+            OperationCounter.enable()
+            a + a
+        assert counts == {'add':1}
+        a * a
+        assert OperationCounter.counter == {}
+    finally:
+        OperationCounter.enable()
+    assert OperationCounter.counter == {'add':1, 'sub':2}
+
+def test_inplace():
+    v = [1]
+    with count_ops() as counts:
+        a = OperationCounter(v)
+        b = a
+        a += OperationCounter([2])
+        assert a is b
+        assert v == [1, 2]
+        assert counts == {'iadd':1}
+
+def test_slots():
+    a = OperationCounter(3)
+    assert not hasattr(a, '__dict__')
+    with pytest.raises(AttributeError):
+        a.w = 4
+    assert weakref.ref(a)() is a